@@ -10,70 +10,28 @@ file programmatically in Python for reliability and speed.
 This script is called by the Node.js server with command-line arguments.
 """
 
-import google.generativeai as genai
 import os
 import sys
 import argparse
+import functools
+import hashlib
+import json
 import re
+import tempfile
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-# Configure the API key from environment variable
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
-if not GEMINI_API_KEY:
-    print("ERROR: GEMINI_API_KEY environment variable not set", file=sys.stderr)
-    sys.exit(1)
-
-genai.configure(api_key=GEMINI_API_KEY)
-
-# Initialize model from environment variable
+# Model name from environment variable. The Gemini SDK itself is imported and
+# configured lazily (see _get_genai) so --help, argument errors and cache hits
+# never pay for importing it.
 GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
-model = genai.GenerativeModel(GEMINI_MODEL)
-
-
-def upload_syllabus(file_path):
-    """
-    Upload a PDF syllabus file to the Gemini API.
-
-    Args:
-        file_path (str): Path to the PDF file
-
-    Returns:
-        File object from Gemini API
-
-    Raises:
-        FileNotFoundError: If the specified file doesn't exist
-    """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    print("STATUS: Uploading PDF to Gemini AI...")
-    print(f"[UPLOAD] Uploading file: {file_path}")
-    pdf_file = genai.upload_file(path=file_path)
-    print("[OK] File uploaded successfully to Gemini AI\n")
-    return pdf_file
 
-
-def extract_events_from_syllabus(pdf_file, class_name, section_number, semester_start, semester_end, timezone):
-    """
-    LLM CALL #1: Extract all events, deadlines, and class schedules from the syllabus.
-
-    This extracts structured event information for a specific section that will be
-    used to generate the .ics file. Some syllabi contain multiple sections with
-    different schedules, so the section number is used to extract the correct dates.
-
-    Args:
-        pdf_file: Uploaded file object from Gemini API
-        class_name (str): Name of the class (e.g., "CSCE 311")
-        section_number (str): Section number (e.g., "546")
-        semester_start (str): Semester start date in MM/DD/YYYY format (for calculating relative dates)
-        semester_end (str): Semester end date in MM/DD/YYYY format (for calculating relative dates)
-        timezone (str): Timezone for the events (e.g., "America/Chicago", "America/New_York")
-
-    Returns:
-        str: Extracted events in structured format
-    """
-    prompt = f'''Analyze this syllabus and extract ALL scheduled events for SECTION {section_number} of {class_name}.
+# Extraction prompt. Only the {placeholders} vary per request; the rest is
+# built once at import.
+_EXTRACTION_PROMPT_TEMPLATE = '''Analyze this syllabus and extract ALL scheduled events for SECTION {section_number} of {class_name}.
 
 SEMESTER INFORMATION (for calculating dates):
 - Semester Start: {semester_start}
@@ -127,14 +85,405 @@ Remember:
 - ESTIMATE dates from relative references (Week 5, Finals Week, etc.)
 - Convert times to 24-hour format considering timezone {timezone}'''
 
+# Version of the extraction prompt, derived from the template so that any
+# edit to it invalidates previously cached extractions
+PROMPT_VERSION = hashlib.sha256(_EXTRACTION_PROMPT_TEMPLATE.encode('utf-8')).hexdigest()[:8]
+
+# Day name mappings for recurring events
+DAY_MAP = {
+    'monday': 'MO', 'mon': 'MO', 'mo': 'MO', 'm': 'MO',
+    'tuesday': 'TU', 'tues': 'TU', 'tue': 'TU', 'tu': 'TU', 't': 'TU',
+    'wednesday': 'WE', 'wed': 'WE', 'we': 'WE', 'w': 'WE',
+    'thursday': 'TH', 'thurs': 'TH', 'thur': 'TH', 'thu': 'TH', 'th': 'TH', 'r': 'TH',
+    'friday': 'FR', 'fri': 'FR', 'fr': 'FR', 'f': 'FR',
+    'saturday': 'SA', 'sat': 'SA', 'sa': 'SA', 's': 'SA',
+    'sunday': 'SU', 'sun': 'SU', 'su': 'SU'
+}
+
+# iCalendar day codes to datetime.weekday() values
+DAY_TO_WEEKDAY = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+
+# Matches whole day names/abbreviations only, so "Wednesday" no longer also
+# matches "s" (Saturday) and "Oct 15" is not mistaken for a recurring event.
+# Longer names come first so the alternation prefers the full word, and an
+# optional trailing "s" accepts plurals such as "Tuesdays/Thursdays".
+_DAY_RE = re.compile(
+    r'\b(' + '|'.join(sorted(DAY_MAP, key=len, reverse=True)) + r')s?\b',
+    re.IGNORECASE
+)
+
+# Compact day codes written as one run of letters (e.g. "MWF", "TR", "TTh", "MoWe").
+# Two-letter codes come first so "TTh" splits into "T" + "Th", not "T" + "T" + "h".
+_COMPACT_DAY_TOKEN = r'mo|tu|we|th|fr|sa|su|[mtwrfs]'
+_COMPACT_DAYS_RE = re.compile(r'^(?:' + _COMPACT_DAY_TOKEN + r')+$', re.IGNORECASE)
+_COMPACT_DAY_TOKEN_RE = re.compile(_COMPACT_DAY_TOKEN, re.IGNORECASE)
+
+# Strips everything except digits, colons and dashes from time strings
+_TIME_CLEAN_RE = re.compile(r'[^\d:-]')
+
+# Translation table for escaping iCalendar TEXT values in a single pass
+_ICS_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\',
+    ';': '\\;',
+    ',': '\\,',
+    '\n': '\\n'
+})
+
+# Default location for cached extractions when --cache-dir is given without a path
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'aggieace')
+
+# Default number of jobs converted concurrently in --server mode
+DEFAULT_SERVER_WORKERS = 4
+
+# Fields every --server job must provide ("tz" is optional)
+SERVER_JOB_FIELDS = ('pdf', 'class_name', 'section', 'start', 'end', 'out')
+
+
+class MissingAPIKeyError(EnvironmentError):
+    """Raised when GEMINI_API_KEY is not set."""
+
+
+def _get_api_key():
+    """
+    Read the Gemini API key from the environment.
+
+    Returns:
+        str: The API key
+
+    Raises:
+        MissingAPIKeyError: If GEMINI_API_KEY is not set
+    """
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        raise MissingAPIKeyError("GEMINI_API_KEY environment variable not set")
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def _get_genai():
+    """
+    Import the Gemini SDK and configure it with the API key on first use.
+
+    Returns:
+        module: The configured google.generativeai module
+
+    Raises:
+        MissingAPIKeyError: If GEMINI_API_KEY is not set
+    """
+    api_key = _get_api_key()
+
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Create the Gemini model once and reuse it for every extraction."""
+    return _get_genai().GenerativeModel(GEMINI_MODEL)
+
+
+def _retry(fn, *, attempts=3, base=1.0):
+    """
+    Call fn, retrying transient Gemini API errors with linear backoff.
+
+    Waits base, 2*base, ... seconds between attempts. Non-transient errors
+    and the final failed attempt are re-raised.
+
+    Args:
+        fn (callable): Zero-argument function performing the API call
+        attempts (int): Maximum number of calls
+        base (float): Backoff unit in seconds
+
+    Returns:
+        The return value of fn
+    """
+    from google.api_core import exceptions as api_exceptions
+
+    transient_errors = (
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.DeadlineExceeded,
+        api_exceptions.InternalServerError
+    )
+
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except transient_errors as e:
+            if attempt == attempts - 1:
+                raise
+            delay = base * (attempt + 1)
+            print(f"[RETRY] Gemini API error ({type(e).__name__}), retrying in {delay:g}s "
+                  f"(attempt {attempt + 2} of {attempts})")
+            time.sleep(delay)
+
+
+def compute_pdf_hash(file_path):
+    """
+    Compute the SHA-256 hash of a PDF file's contents.
+
+    Args:
+        file_path (str): Path to the PDF file
+
+    Returns:
+        str: SHA-256 hash as hex string
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_cache_key(pdf_hash, class_name, section_number, semester_start, semester_end, timezone):
+    """
+    Build the content-addressable cache key for an extraction.
+
+    The key covers everything that influences the LLM output: provider, model,
+    prompt version, section, semester window, timezone and the PDF contents.
+
+    Args:
+        pdf_hash (str): SHA-256 hash of the PDF file
+        class_name (str): Name of the class (e.g., "CSCE 311")
+        section_number (str): Section number (e.g., "546")
+        semester_start (str): Semester start date in MM/DD/YYYY format
+        semester_end (str): Semester end date in MM/DD/YYYY format
+        timezone (str): Timezone for the events
+
+    Returns:
+        str: Cache key as hex string
+    """
+    parts = (
+        'gemini',
+        GEMINI_MODEL,
+        PROMPT_VERSION,
+        class_name,
+        section_number,
+        semester_start,
+        semester_end,
+        timezone,
+        pdf_hash
+    )
+
+    hasher = hashlib.sha256()
+    for part in parts:
+        encoded = str(part).encode('utf-8')
+        # Length-prefix each field so ("ab", "c") and ("a", "bc") hash differently
+        hasher.update(len(encoded).to_bytes(8, 'big'))
+        hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+def load_cached_extraction(cache_dir, cache_key):
+    """
+    Load a previously cached extraction.
+
+    Args:
+        cache_dir (str): Directory holding cached extractions
+        cache_key (str): Key from build_cache_key()
+
+    Returns:
+        str or None: Cached extraction text, or None on a cache miss
+    """
+    cache_path = os.path.join(cache_dir, f"{cache_key}.txt")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            extracted_events = f.read()
+    except OSError:
+        return None
+
+    return extracted_events if extracted_events.strip() else None
+
+
+def _atomic_write(path, content):
+    """Write content to path via a temporary file so readers never see partial data."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_cached_extraction(cache_dir, cache_key, extracted_events, metadata):
+    """
+    Save an extraction to the cache along with a JSON metadata sidecar.
+
+    Cache write failures are reported but never fail the conversion.
+
+    Args:
+        cache_dir (str): Directory holding cached extractions
+        cache_key (str): Key from build_cache_key()
+        extracted_events (str): Raw extraction text from the LLM
+        metadata (dict): Configuration the extraction was produced with
+    """
+    sidecar = dict(metadata)
+    sidecar['cached_at'] = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write the sidecar first: the .txt file's presence marks a cache hit
+        _atomic_write(os.path.join(cache_dir, f"{cache_key}.json"), json.dumps(sidecar, indent=2))
+        _atomic_write(os.path.join(cache_dir, f"{cache_key}.txt"), extracted_events)
+        print(f"[CACHE] Saved extraction to cache: {cache_key}")
+    except OSError as e:
+        print(f"[WARN] Failed to write extraction cache: {str(e)}")
+
+
+def find_uploaded_syllabus(display_name):
+    """
+    Find a previously uploaded file that is still active in the Gemini File API.
+
+    Lookup failures are reported and treated as "not found" so that the
+    caller falls back to a regular upload.
+
+    Args:
+        display_name (str): Display name the file was uploaded with
+
+    Returns:
+        File object from Gemini API, or None if no active upload exists
+    """
+    genai = _get_genai()
+    try:
+        for uploaded_file in genai.list_files():
+            if uploaded_file.display_name == display_name and uploaded_file.state.name == "ACTIVE":
+                return uploaded_file
+    except Exception as e:
+        print(f"[WARN] Could not list uploaded files, uploading again: {str(e)}")
+
+    return None
+
+
+def upload_syllabus(file_path, pdf_hash=None):
+    """
+    Upload a PDF syllabus file to the Gemini API.
+
+    Uploads are named after the PDF's content hash, so a file with identical
+    bytes that is still held by the File API is reused instead of re-uploaded.
+
+    Args:
+        file_path (str): Path to the PDF file
+        pdf_hash (str): SHA-256 hash of the file from compute_pdf_hash(), computed if omitted
+
+    Returns:
+        File object from Gemini API
+
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+    """
+    if pdf_hash is None:
+        pdf_hash = compute_pdf_hash(file_path)
+
+    display_name = f"aggieace-{pdf_hash[:16]}"
+
+    print("STATUS: Uploading PDF to Gemini AI...")
+    existing_file = find_uploaded_syllabus(display_name)
+    if existing_file:
+        print(f"[UPLOAD] Reusing previously uploaded file: {display_name}")
+        print("[OK] File already available in Gemini AI\n")
+        return existing_file
+
+    print(f"[UPLOAD] Uploading file: {file_path}")
+    genai = _get_genai()
+    pdf_file = _retry(lambda: genai.upload_file(
+        path=file_path,
+        mime_type='application/pdf',
+        display_name=display_name
+    ))
+    print("[OK] File uploaded successfully to Gemini AI\n")
+    return pdf_file
+
+
+def build_extraction_prompt(class_name, section_number, semester_start, semester_end, timezone):
+    """
+    Build the extraction prompt for a specific class section.
+
+    Args:
+        class_name (str): Name of the class (e.g., "CSCE 311")
+        section_number (str): Section number (e.g., "546")
+        semester_start (str): Semester start date in MM/DD/YYYY format (for calculating relative dates)
+        semester_end (str): Semester end date in MM/DD/YYYY format (for calculating relative dates)
+        timezone (str): Timezone for the events (e.g., "America/Chicago", "America/New_York")
+
+    Returns:
+        str: Prompt text for the extraction LLM call
+    """
+    return _EXTRACTION_PROMPT_TEMPLATE.format(
+        class_name=class_name,
+        section_number=section_number,
+        semester_start=semester_start,
+        semester_end=semester_end,
+        timezone=timezone
+    )
+
+
+def extract_events_from_syllabus(pdf_file, class_name, section_number, semester_start, semester_end, timezone, prompt=None):
+    """
+    LLM CALL #1: Extract all events, deadlines, and class schedules from the syllabus.
+
+    This extracts structured event information for a specific section that will be
+    used to generate the .ics file. Some syllabi contain multiple sections with
+    different schedules, so the section number is used to extract the correct dates.
+
+    Args:
+        pdf_file: Uploaded file object from Gemini API
+        class_name (str): Name of the class (e.g., "CSCE 311")
+        section_number (str): Section number (e.g., "546")
+        semester_start (str): Semester start date in MM/DD/YYYY format (for calculating relative dates)
+        semester_end (str): Semester end date in MM/DD/YYYY format (for calculating relative dates)
+        timezone (str): Timezone for the events (e.g., "America/Chicago", "America/New_York")
+        prompt (str): Prebuilt prompt from build_extraction_prompt(), built here if omitted
+
+    Returns:
+        generator: Chunks of extracted event text, yielded as they stream in
+    """
+    if prompt is None:
+        prompt = build_extraction_prompt(class_name, section_number, semester_start, semester_end, timezone)
+
     print("\nSTATUS: Analyzing syllabus with AI (Step 1 of 2)...")
     print("="*70)
     print(f"[LLM] LLM CALL #1: Extracting events for Section {section_number}")
     print(f"Timezone: {timezone}")
     print("="*70)
 
-    response = model.generate_content([prompt, pdf_file])
-    extracted_events = response.text.strip()
+    # Stream the response so events can be parsed while tokens are still arriving
+    model = _get_model()
+    response_stream = _retry(lambda: model.generate_content([prompt, pdf_file], stream=True))
+    return _iter_response_text(response_stream)
+
+
+def _iter_response_text(response_stream):
+    """
+    Yield the text of each streamed response chunk, then log the full extraction.
+
+    Args:
+        response_stream: Streaming response from model.generate_content()
+
+    Yields:
+        str: Text of each response chunk
+
+    Raises:
+        ValueError: If the response contained no text
+    """
+    chunks = []
+    for chunk in response_stream:
+        try:
+            text = chunk.text
+        except ValueError:
+            # Chunks carrying only a finish reason, usage metadata or thinking
+            # parts have no text; an empty extraction is reported below
+            continue
+        if text:
+            chunks.append(text)
+            yield text
+
+    extracted_events = ''.join(chunks).strip()
 
     if not extracted_events:
         raise ValueError("No events extracted from syllabus. The syllabus may be empty or unreadable.")
@@ -144,43 +493,55 @@ Remember:
     print(extracted_events)
     print()
 
-    return extracted_events
 
+def _collect_chunks(chunks, collected):
+    """Pass chunks through unchanged while appending each one to collected."""
+    for chunk in chunks:
+        collected.append(chunk)
+        yield chunk
 
-def parse_extracted_events(extracted_events, semester_start, semester_end):
+
+def _iter_lines(chunks):
+    """
+    Reassemble text chunks into complete lines.
+
+    Args:
+        chunks (iterable): Text chunks that may split lines at arbitrary points
+
+    Yields:
+        str: Each line, without its trailing newline
     """
-    Parse the LLM-extracted events into a structured list.
+    residual = ''
+    for chunk in chunks:
+        residual += chunk
+        *lines, residual = residual.split('\n')
+        yield from lines
+
+    if residual:
+        yield residual
+
+
+def parse_extracted_events(extracted_events, sem_start, sem_end):
+    """
+    Parse the LLM-extracted events into structured event dictionaries.
 
     Handles various formats that the LLM might output:
     - Pipe-separated: EventName | Date(s) | Time | Location
     - Tab-separated or other delimiters
 
     Args:
-        extracted_events (str): Raw event text from LLM
-        semester_start (str): Semester start date MM/DD/YYYY
-        semester_end (str): Semester end date MM/DD/YYYY
-
-    Returns:
-        list: List of event dictionaries
-    """
-    events = []
-    lines = extracted_events.strip().split('\n')
-
-    # Day name mappings for recurring events
-    day_map = {
-        'monday': 'MO', 'mon': 'MO', 'm': 'MO',
-        'tuesday': 'TU', 'tue': 'TU', 'tu': 'TU', 't': 'TU',
-        'wednesday': 'WE', 'wed': 'WE', 'w': 'WE',
-        'thursday': 'TH', 'thu': 'TH', 'th': 'TH', 'r': 'TH',
-        'friday': 'FR', 'fri': 'FR', 'f': 'FR',
-        'saturday': 'SA', 'sat': 'SA', 's': 'SA',
-        'sunday': 'SU', 'sun': 'SU', 'su': 'SU'
-    }
+        extracted_events (str or iterable): Raw event text from LLM, either whole
+                                            or as a stream of text chunks
+        sem_start (datetime): Semester start date
+        sem_end (datetime): Semester end date
 
-    sem_start = datetime.strptime(semester_start, '%m/%d/%Y')
-    sem_end = datetime.strptime(semester_end, '%m/%d/%Y')
+    Yields:
+        dict: Each event as soon as its line has been received
+    """
+    if isinstance(extracted_events, str):
+        extracted_events = [extracted_events]
 
-    for line in lines:
+    for line in _iter_lines(extracted_events):
         line = line.strip()
         if not line or line.startswith('#') or line.startswith('-'):
             continue
@@ -209,13 +570,7 @@ def parse_extracted_events(extracted_events, semester_start, semester_end):
         location = location.strip()
 
         # Determine if recurring (contains day names) or single date
-        date_lower = date_str.lower()
-        recurring_days = []
-
-        # Check for day names (indicates recurring)
-        for day_name, day_code in day_map.items():
-            if day_name in date_lower and day_code not in recurring_days:
-                recurring_days.append(day_code)
+        recurring_days = parse_recurring_days(date_str)
 
         if recurring_days:
             # This is a recurring event
@@ -244,9 +599,59 @@ def parse_extracted_events(extracted_events, semester_start, semester_end):
                 print(f"[WARN] Skipping event with unparseable date: {event_name} | {date_str}")
                 continue
 
-        events.append(event)
+        yield event
+
+
+def parse_recurring_days(date_str):
+    """
+    Extract iCalendar day codes from a recurring-schedule date field.
+
+    Handles:
+    - Day names/abbreviations as separate words, singular or plural
+      ("Monday-Wednesday-Friday", "Tue/Thu", "Tuesdays/Thursdays")
+    - Compact day codes ("MWF", "TR", "TTh", "MoWe")
+
+    Args:
+        date_str (str): Date field from the extracted event
+
+    Returns:
+        list: Day codes in first-seen order (e.g. ['MO', 'WE', 'FR']),
+              empty if the field is not a recurring schedule
+
+    Examples:
+        >>> parse_recurring_days('MWF')
+        ['MO', 'WE', 'FR']
+        >>> parse_recurring_days('TR')
+        ['TU', 'TH']
+        >>> parse_recurring_days('TTh')
+        ['TU', 'TH']
+        >>> parse_recurring_days('MoWe')
+        ['MO', 'WE']
+        >>> parse_recurring_days('Monday-Wednesday-Friday')
+        ['MO', 'WE', 'FR']
+        >>> parse_recurring_days('Tuesdays/Thursdays')
+        ['TU', 'TH']
+        >>> parse_recurring_days('Mondays and Wednesdays')
+        ['MO', 'WE']
+        >>> parse_recurring_days('Oct 15')
+        []
+        >>> parse_recurring_days('November 20, 2025')
+        []
+    """
+    # dict.fromkeys keeps the first-seen order while dropping duplicates
+    recurring_days = list(dict.fromkeys(
+        DAY_MAP[match.group(1).lower()] for match in _DAY_RE.finditer(date_str)
+    ))
+    if recurring_days:
+        return recurring_days
+
+    compact = date_str.strip()
+    if _COMPACT_DAYS_RE.match(compact):
+        return list(dict.fromkeys(
+            DAY_MAP[token.lower()] for token in _COMPACT_DAY_TOKEN_RE.findall(compact)
+        ))
 
-    return events
+    return []
 
 
 def parse_date(date_str, sem_start, sem_end):
@@ -267,49 +672,41 @@ def parse_date(date_str, sem_start, sem_end):
         datetime or None if parsing fails
     """
     date_str = date_str.strip()
+    if not date_str:
+        return None
+
+    # Choose candidate formats from the shape of the string, so the common
+    # numeric cases take a single strptime attempt instead of failing through
+    # every format. Each entry is (format, needs semester year).
+    if date_str[0].isdigit():
+        slash_count = date_str.count('/')
+        if slash_count == 2:
+            # MM/DD/YYYY
+            formats = [('%m/%d/%Y', False)]
+        elif slash_count == 1:
+            # MM/DD (use semester year)
+            formats = [('%m/%d', True)]
+        else:
+            return None
+    elif ',' in date_str:
+        # "Month DD, YYYY"
+        formats = [('%B %d, %Y', False)]
+    else:
+        # "Month DD", then "Mon DD" (abbreviated month)
+        formats = [('%B %d', True), ('%b %d', True)]
 
-    # Try MM/DD/YYYY
-    try:
-        return datetime.strptime(date_str, '%m/%d/%Y')
-    except ValueError:
-        pass
-
-    # Try MM/DD (use semester year)
-    try:
-        dt = datetime.strptime(date_str, '%m/%d')
-        # Determine which year based on semester
-        dt = dt.replace(year=sem_start.year)
-        if dt < sem_start:
-            dt = dt.replace(year=sem_end.year)
-        return dt
-    except ValueError:
-        pass
-
-    # Try "Month DD, YYYY"
-    try:
-        return datetime.strptime(date_str, '%B %d, %Y')
-    except ValueError:
-        pass
-
-    # Try "Month DD"
-    try:
-        dt = datetime.strptime(date_str, '%B %d')
-        dt = dt.replace(year=sem_start.year)
-        if dt < sem_start:
-            dt = dt.replace(year=sem_end.year)
-        return dt
-    except ValueError:
-        pass
+    for date_format, needs_year in formats:
+        try:
+            dt = datetime.strptime(date_str, date_format)
+        except ValueError:
+            continue
 
-    # Try "Mon DD" (abbreviated month)
-    try:
-        dt = datetime.strptime(date_str, '%b %d')
-        dt = dt.replace(year=sem_start.year)
-        if dt < sem_start:
-            dt = dt.replace(year=sem_end.year)
+        if needs_year:
+            # Determine which year based on semester
+            dt = dt.replace(year=sem_start.year)
+            if dt < sem_start:
+                dt = dt.replace(year=sem_end.year)
         return dt
-    except ValueError:
-        pass
 
     return None
 
@@ -325,19 +722,15 @@ def find_first_occurrence(start_date, days):
     Returns:
         datetime: First occurrence date
     """
-    day_to_weekday = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
-    target_weekdays = [day_to_weekday[d] for d in days if d in day_to_weekday]
+    target_weekdays = [DAY_TO_WEEKDAY[d] for d in days if d in DAY_TO_WEEKDAY]
 
     if not target_weekdays:
         return start_date
 
-    current = start_date
-    for _ in range(7):  # Search up to 7 days
-        if current.weekday() in target_weekdays:
-            return current
-        current += timedelta(days=1)
-
-    return start_date
+    # Days until each target weekday, wrapping around the week
+    start_weekday = start_date.weekday()
+    offset = min((weekday - start_weekday) % 7 for weekday in target_weekdays)
+    return start_date + timedelta(days=offset)
 
 
 def parse_time(time_str):
@@ -362,7 +755,7 @@ def parse_time(time_str):
         return (None, None, True)
 
     # Remove any extra text
-    time_str = re.sub(r'[^\d:-]', '', time_str)
+    time_str = _TIME_CLEAN_RE.sub('', time_str)
 
     if '-' in time_str:
         parts = time_str.split('-')
@@ -410,13 +803,70 @@ def escape_ics_text(text):
     Returns:
         str: Escaped text
     """
-    if not text:
-        return ""
-    text = text.replace('\\', '\\\\')
-    text = text.replace(';', '\\;')
-    text = text.replace(',', '\\,')
-    text = text.replace('\n', '\\n')
-    return text
+    return text.translate(_ICS_ESCAPE_TABLE) if text else ""
+
+
+def _iter_vevent_blocks(extracted_events, sem_start, sem_end, escaped_class_name, dtstamp, until_date, run_id):
+    """
+    Parse extracted events and yield each one as a complete VEVENT block.
+
+    Parsing is lazy, so a streamed extraction is turned into VEVENTs while the
+    rest of the response is still arriving, and only one event is held at a time.
+
+    Args:
+        extracted_events (str or iterable): Raw event text from LLM, whole or as chunks
+        sem_start (datetime): Semester start date
+        sem_end (datetime): Semester end date
+        escaped_class_name (str): ICS-escaped "Class (Section)" name for summaries
+        dtstamp (str): DTSTAMP value shared by all events
+        until_date (str): RRULE UNTIL value for recurring events
+        run_id (str): Random per-calendar prefix for event UIDs
+
+    Yields:
+        str: CRLF-joined VEVENT block
+    """
+    events = parse_extracted_events(extracted_events, sem_start, sem_end)
+
+    for index, event in enumerate(events, start=1):
+        event_uid = f"{run_id}-{index:04x}@aggieace.converter"
+        event_name = escape_ics_text(event['name'])
+        location = escape_ics_text(event.get('location', 'TBA'))
+
+        start_time, end_time, is_all_day = parse_time(event.get('time', 'all-day'))
+
+        if event['type'] == 'recurring':
+            # Recurring event with a weekly recurrence rule
+            event_date = event['start_date']
+            days_str = ','.join(event['days'])
+            details = (
+                f"RRULE:FREQ=WEEKLY;BYDAY={days_str};UNTIL={until_date}\r\n"
+                f"DESCRIPTION:Recurring {event_name}"
+            )
+        else:
+            # Single event
+            event_date = event['date']
+            details = f"DESCRIPTION:{event_name}"
+
+        date_str = event_date.strftime('%Y%m%d')
+        if is_all_day:
+            next_day = (event_date + timedelta(days=1)).strftime('%Y%m%d')
+            timing = f"DTSTART;VALUE=DATE:{date_str}\r\nDTEND;VALUE=DATE:{next_day}"
+        else:
+            timing = f"DTSTART:{date_str}T{start_time}\r\nDTEND:{date_str}T{end_time}"
+
+        # Each VEVENT is built as one CRLF-joined block so the final join
+        # concatenates one string per event rather than one per line
+        yield (
+            "BEGIN:VEVENT\r\n"
+            f"UID:{event_uid}\r\n"
+            f"DTSTAMP:{dtstamp}\r\n"
+            f"SUMMARY:{escaped_class_name} - {event_name}\r\n"
+            f"LOCATION:{location}\r\n"
+            "STATUS:CONFIRMED\r\n"
+            f"{timing}\r\n"
+            f"{details}\r\n"
+            "END:VEVENT"
+        )
 
 
 def generate_ics_file(extracted_events, class_name, section_number, semester_start, semester_end, timezone):
@@ -426,7 +876,8 @@ def generate_ics_file(extracted_events, class_name, section_number, semester_sta
     This generates the final iCalendar format with proper recurring events and timezones.
 
     Args:
-        extracted_events (str): Structured event data from extract_events_from_syllabus()
+        extracted_events (str or iterable): Structured event data from extract_events_from_syllabus(),
+                                            either whole or as a stream of text chunks
         class_name (str): Name of the class (e.g., "CSCE 311")
         section_number (str): Section number (e.g., "546")
         semester_start (str): Semester start date in MM/DD/YYYY format
@@ -441,23 +892,19 @@ def generate_ics_file(extracted_events, class_name, section_number, semester_sta
     print("[GENERATOR] Python ICS Generator (no LLM call)")
     print("="*70)
 
-    # Parse the extracted events
-    events = parse_extracted_events(extracted_events, semester_start, semester_end)
-
-    if not events:
-        raise ValueError("No valid events could be parsed from extraction")
-
-    print(f"[EVENTS] Parsed {len(events)} events from extraction")
+    # Semester dates are parsed once here and shared with the parser
+    sem_start = datetime.strptime(semester_start, '%m/%d/%Y')
+    sem_end = datetime.strptime(semester_end, '%m/%d/%Y')
 
     # Format the full class name with section number
     full_class_name = f"{class_name} ({section_number})"
+    escaped_class_name = escape_ics_text(full_class_name)
 
     # Current timestamp for DTSTAMP
     now = datetime.utcnow()
     dtstamp = now.strftime('%Y%m%dT%H%M%SZ')
 
-    # Parse semester end for RRULE UNTIL
-    sem_end = datetime.strptime(semester_end, '%m/%d/%Y')
+    # RRULE UNTIL is the same for every recurring event
     until_date = sem_end.strftime('%Y%m%dT235959')
 
     # Build .ics content
@@ -467,67 +914,51 @@ def generate_ics_file(extracted_events, class_name, section_number, semester_sta
         "CALSCALE:GREGORIAN",
         "PRODID:-//AggieAce//Syllabus Converter//EN",
         f"X-WR-TIMEZONE:{timezone}",
-        f"X-WR-CALNAME:{escape_ics_text(full_class_name)}"
+        f"X-WR-CALNAME:{escaped_class_name}"
     ]
 
-    for event in events:
-        event_uid = f"{uuid.uuid4()}@aggieace.converter"
-        event_name = escape_ics_text(event['name'])
-        location = escape_ics_text(event.get('location', 'TBA'))
-        summary = f"{escape_ics_text(full_class_name)} - {event_name}"
-
-        start_time, end_time, is_all_day = parse_time(event.get('time', 'all-day'))
-
-        ics_lines.append("BEGIN:VEVENT")
-        ics_lines.append(f"UID:{event_uid}")
-        ics_lines.append(f"DTSTAMP:{dtstamp}")
-        ics_lines.append(f"SUMMARY:{summary}")
-        ics_lines.append(f"LOCATION:{location}")
-        ics_lines.append(f"STATUS:CONFIRMED")
-
-        if event['type'] == 'recurring':
-            # Recurring event
-            start_date = event['start_date']
-
-            if is_all_day:
-                date_str = start_date.strftime('%Y%m%d')
-                next_day = (start_date + timedelta(days=1)).strftime('%Y%m%d')
-                ics_lines.append(f"DTSTART;VALUE=DATE:{date_str}")
-                ics_lines.append(f"DTEND;VALUE=DATE:{next_day}")
-            else:
-                date_str = start_date.strftime('%Y%m%d')
-                ics_lines.append(f"DTSTART:{date_str}T{start_time}")
-                ics_lines.append(f"DTEND:{date_str}T{end_time}")
-
-            # Add recurrence rule
-            days_str = ','.join(event['days'])
-            ics_lines.append(f"RRULE:FREQ=WEEKLY;BYDAY={days_str};UNTIL={until_date}")
-            ics_lines.append(f"DESCRIPTION:Recurring {event_name}")
-        else:
-            # Single event
-            event_date = event['date']
-
-            if is_all_day:
-                date_str = event_date.strftime('%Y%m%d')
-                next_day = (event_date + timedelta(days=1)).strftime('%Y%m%d')
-                ics_lines.append(f"DTSTART;VALUE=DATE:{date_str}")
-                ics_lines.append(f"DTEND;VALUE=DATE:{next_day}")
-            else:
-                date_str = event_date.strftime('%Y%m%d')
-                ics_lines.append(f"DTSTART:{date_str}T{start_time}")
-                ics_lines.append(f"DTEND:{date_str}T{end_time}")
-
-            ics_lines.append(f"DESCRIPTION:{event_name}")
+    # One random ID per calendar plus a per-event counter keeps UIDs globally
+    # unique without reading from the OS random source for every event
+    run_id = uuid.uuid4().hex
+
+    # Each event is parsed and emitted in one pass; no event list is built.
+    # VEVENT tags are balanced as blocks are appended, so the finished
+    # calendar never has to be rescanned for validation.
+    event_count = 0
+    vevent_open = 0
+    vevent_total = 0
+    for vevent_block in _iter_vevent_blocks(
+        extracted_events,
+        sem_start,
+        sem_end,
+        escaped_class_name,
+        dtstamp,
+        until_date,
+        run_id
+    ):
+        if vevent_block.startswith("BEGIN:VEVENT"):
+            vevent_open += 1
+        if vevent_block.endswith("END:VEVENT"):
+            vevent_open -= 1
+            vevent_total += 1
+        ics_lines.append(vevent_block)
+        event_count += 1
+
+    if not event_count:
+        raise ValueError("No valid events could be parsed from extraction")
 
-        ics_lines.append("END:VEVENT")
+    print(f"[EVENTS] Parsed {event_count} events from extraction")
 
     ics_lines.append("END:VCALENDAR")
 
     ics_content = '\r\n'.join(ics_lines)
 
-    # Validate the .ics content
+    # Validate the .ics structure using the counters kept during assembly
     print("\nSTATUS: Validating calendar format...")
-    validate_ics_content(ics_content)
+    if vevent_open != 0 or vevent_total != event_count:
+        raise ValueError("Invalid .ics file: mismatched VEVENT tags")
+
+    print(f"[OK] ICS validation passed: {vevent_total} events found")
 
     print("[OK] Python ICS Generation Complete")
     print()
@@ -535,39 +966,6 @@ def generate_ics_file(extracted_events, class_name, section_number, semester_sta
     return ics_content
 
 
-def validate_ics_content(ics_content):
-    """
-    Validate that the generated .ics content is well-formed.
-
-    Args:
-        ics_content (str): The .ics file content
-
-    Raises:
-        ValueError: If .ics content is malformed
-    """
-    required_elements = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "CALSCALE:GREGORIAN",
-        "END:VCALENDAR"
-    ]
-
-    for element in required_elements:
-        if element not in ics_content:
-            raise ValueError(f"Invalid .ics file: missing required element '{element}'")
-
-    # Check for at least one event
-    if "BEGIN:VEVENT" not in ics_content or "END:VEVENT" not in ics_content:
-        raise ValueError("Invalid .ics file: no events found")
-
-    # Count events
-    event_count = ics_content.count("BEGIN:VEVENT")
-    if event_count != ics_content.count("END:VEVENT"):
-        raise ValueError(f"Invalid .ics file: mismatched VEVENT tags")
-
-    print(f"[OK] ICS validation passed: {event_count} events found")
-
-
 def save_ics_file(ics_content, output_file):
     """
     Save the generated iCalendar content to a .ics file.
@@ -580,10 +978,10 @@ def save_ics_file(ics_content, output_file):
         IOError: If file cannot be written
     """
     print("\nSTATUS: Saving calendar file...")
-    # Ensure directory exists
+    # Ensure directory exists (exist_ok: concurrent --server jobs may create it too)
     output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -629,7 +1027,8 @@ def convert_syllabus_to_calendar(
     semester_start,
     semester_end,
     output_file,
-    timezone="America/Chicago"
+    timezone="America/Chicago",
+    cache_dir=None
 ):
     """
     Main function to convert a syllabus PDF into a calendar .ics file.
@@ -653,6 +1052,7 @@ def convert_syllabus_to_calendar(
                        - "America/New_York" (Eastern Time)
                        - "America/Los_Angeles" (Pacific Time)
                        - "America/Denver" (Mountain Time)
+        cache_dir (str): Directory for cached extractions, or None to disable caching
 
     Returns:
         str: Generated .ics file content
@@ -678,18 +1078,60 @@ def convert_syllabus_to_calendar(
     validate_date_format(semester_end)
 
     try:
-        # Step 1: Upload the syllabus PDF
-        pdf_file = upload_syllabus(pdf_path)
-
-        # Step 2: LLM Call #1 - Extract events from syllabus for specific section
-        extracted_events = extract_events_from_syllabus(
-            pdf_file,
-            class_name,
-            section_number,
-            semester_start,
-            semester_end,
-            timezone
-        )
+        # Check the extraction cache before paying for an upload and LLM call
+        extracted_events = None
+        extracted_chunks = []
+        cache_key = None
+        pdf_hash = None
+        if cache_dir:
+            pdf_hash = compute_pdf_hash(pdf_path)
+            cache_key = build_cache_key(
+                pdf_hash,
+                class_name,
+                section_number,
+                semester_start,
+                semester_end,
+                timezone
+            )
+            extracted_events = load_cached_extraction(cache_dir, cache_key)
+            if extracted_events:
+                print(f"[CACHE] Cache HIT - reusing extraction: {cache_key}\n")
+            else:
+                print(f"[CACHE] Cache MISS - extracting with AI: {cache_key}\n")
+
+        if not extracted_events:
+            # Step 1: Upload the syllabus PDF. The upload is network-bound, so it
+            # runs in the background while the prompt and output directory are
+            # prepared on this thread.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                upload_future = executor.submit(upload_syllabus, pdf_path, pdf_hash)
+
+                prompt = build_extraction_prompt(
+                    class_name,
+                    section_number,
+                    semester_start,
+                    semester_end,
+                    timezone
+                )
+                output_dir = os.path.dirname(output_file)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+
+                pdf_file = upload_future.result()
+
+            # Step 2: LLM Call #1 - Extract events from syllabus for specific section.
+            # The response is streamed straight into the ICS generator below;
+            # chunks are collected along the way for the cache.
+            extracted_events = extract_events_from_syllabus(
+                pdf_file,
+                class_name,
+                section_number,
+                semester_start,
+                semester_end,
+                timezone,
+                prompt=prompt
+            )
+            extracted_events = _collect_chunks(extracted_events, extracted_chunks)
 
         # Step 3: LLM Call #2 - Generate .ics calendar file
         ics_content = generate_ics_file(
@@ -701,13 +1143,30 @@ def convert_syllabus_to_calendar(
             timezone
         )
 
+        # Only cache extractions that produced a valid calendar
+        if cache_key and extracted_chunks:
+            save_cached_extraction(cache_dir, cache_key, ''.join(extracted_chunks), {
+                'provider': 'gemini',
+                'model': GEMINI_MODEL,
+                'prompt_version': PROMPT_VERSION,
+                'class_name': class_name,
+                'section_number': section_number,
+                'semester_start': semester_start,
+                'semester_end': semester_end,
+                'timezone': timezone,
+                'pdf_sha256': pdf_hash
+            })
+
         # Step 4: Save the calendar file
         save_ics_file(ics_content, output_file)
 
         print("="*70)
         print("[SUCCESS] CONVERSION COMPLETE")
         print("="*70)
-        print(f"Total LLM API calls made: 1 (extraction only)")
+        if extracted_chunks:
+            print("Total LLM API calls made: 1 (extraction only)")
+        else:
+            print("Total LLM API calls made: 0 (extraction served from cache)")
         print(f"ICS generation: Python (no LLM)")
         print(f"Section-specific extraction: Section {section_number}")
         print(f"Timezone: {timezone}")
@@ -731,6 +1190,99 @@ def convert_syllabus_to_calendar(
         raise
 
 
+def _run_server_job(job, cache_dir):
+    """
+    Run a single --server job.
+
+    Args:
+        job (dict): Job fields: job_id, pdf, class_name, section, start, end, tz, out
+        cache_dir (str): Directory for cached extractions, or None to disable caching
+
+    Returns:
+        dict: Response with job_id, status and output (or error)
+    """
+    job_id = job.get('job_id')
+
+    missing = [field for field in SERVER_JOB_FIELDS if not job.get(field)]
+    if missing:
+        return {'job_id': job_id, 'status': 'error', 'error': f"Missing job field(s): {', '.join(missing)}"}
+
+    try:
+        convert_syllabus_to_calendar(
+            pdf_path=job['pdf'],
+            class_name=job['class_name'],
+            section_number=job['section'],
+            semester_start=job['start'],
+            semester_end=job['end'],
+            output_file=job['out'],
+            timezone=job.get('tz') or 'America/Chicago',
+            cache_dir=cache_dir
+        )
+        return {'job_id': job_id, 'status': 'success', 'output': job['out']}
+    except Exception as e:
+        return {'job_id': job_id, 'status': 'error', 'error': str(e)}
+
+
+def _write_response(stream, lock, response):
+    """Write one JSON response line, serialised across worker threads."""
+    with lock:
+        stream.write(json.dumps(response) + '\n')
+        stream.flush()
+
+
+def run_server(max_workers=DEFAULT_SERVER_WORKERS, cache_dir=None):
+    """
+    Serve conversion jobs read from stdin until it is closed.
+
+    Each stdin line is a JSON job ({job_id, pdf, class_name, section, start, end,
+    tz, out}) and produces one JSON line on stdout ({job_id, status, output} or
+    {job_id, status, error}). Jobs run concurrently, so responses may arrive out
+    of order. Progress logs are redirected to stderr to keep stdout parseable.
+
+    A long-lived process pays the interpreter startup and SDK import once and
+    overlaps the network latency of independent jobs.
+
+    Args:
+        max_workers (int): Number of jobs converted concurrently
+        cache_dir (str): Directory for cached extractions, or None to disable caching
+    """
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+    write_lock = threading.Lock()
+
+    # Import the SDK and build the model up front so every job shares them
+    # and a missing API key is reported before any job is accepted
+    _get_model()
+
+    print(f"[SERVER] Ready for jobs ({max_workers} workers)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for line in iter(sys.stdin.readline, ''):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("Job must be a JSON object")
+            except ValueError as e:
+                _write_response(protocol_out, write_lock, {
+                    'job_id': None,
+                    'status': 'error',
+                    'error': f"Invalid job: {str(e)}"
+                })
+                continue
+
+            job.setdefault('job_id', uuid.uuid4().hex)
+            future = executor.submit(_run_server_job, job, cache_dir)
+            future.add_done_callback(
+                lambda done: _write_response(protocol_out, write_lock, done.result())
+            )
+
+    print("[SERVER] stdin closed, shutting down")
+
+
 def main():
     """Parse command-line arguments and run the conversion."""
     parser = argparse.ArgumentParser(
@@ -741,23 +1293,74 @@ Example:
   python process_syllabus.py --pdf syllabus.pdf --class-name "CSCE 120" \\
     --section "520" --start-date "08/25/2025" --end-date "12/16/2025" \\
     --timezone "America/Chicago" --output calendar.ics
+
+  Add --cache-dir to reuse extractions when the same syllabus is converted again.
+
+Server mode (one JSON job per stdin line, one JSON result per stdout line):
+  python process_syllabus.py --server --cache-dir
+  {"job_id": "1", "pdf": "syllabus.pdf", "class_name": "CSCE 120", "section": "520",
+   "start": "08/25/2025", "end": "12/16/2025", "tz": "America/Chicago", "out": "calendar.ics"}
         """
     )
 
-    parser.add_argument('--pdf', required=True, help='Path to the syllabus PDF file')
-    parser.add_argument('--class-name', required=True, help='Class name (e.g., "CSCE 120")')
-    parser.add_argument('--section', required=True, help='Section number (e.g., "520")')
-    parser.add_argument('--start-date', required=True, help='Semester start date (MM/DD/YYYY)')
-    parser.add_argument('--end-date', required=True, help='Semester end date (MM/DD/YYYY)')
+    # Conversion arguments are required unless running in --server mode
+    parser.add_argument('--pdf', help='Path to the syllabus PDF file')
+    parser.add_argument('--class-name', help='Class name (e.g., "CSCE 120")')
+    parser.add_argument('--section', help='Section number (e.g., "520")')
+    parser.add_argument('--start-date', help='Semester start date (MM/DD/YYYY)')
+    parser.add_argument('--end-date', help='Semester end date (MM/DD/YYYY)')
     parser.add_argument('--timezone', default='America/Chicago', help='Timezone (default: America/Chicago)')
-    parser.add_argument('--output', required=True, help='Output .ics file path')
+    parser.add_argument('--output', help='Output .ics file path')
+    parser.add_argument(
+        '--cache-dir',
+        nargs='?',
+        const=DEFAULT_CACHE_DIR,
+        default=None,
+        help=f'Cache LLM extractions in this directory (default when given without a path: {DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Disable the extraction cache')
+    parser.add_argument('--server', action='store_true', help='Serve JSON-line jobs from stdin instead of a single conversion')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_SERVER_WORKERS,
+        help=f'Concurrent jobs in --server mode (default: {DEFAULT_SERVER_WORKERS})'
+    )
 
     args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    if args.server:
+        try:
+            run_server(max_workers=args.workers, cache_dir=cache_dir)
+        except Exception as e:
+            print(f"\n[ERROR] ERROR: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    required = {
+        '--pdf': args.pdf,
+        '--class-name': args.class_name,
+        '--section': args.section,
+        '--start-date': args.start_date,
+        '--end-date': args.end_date,
+        '--output': args.output
+    }
+    missing = [flag for flag, value in required.items() if not value]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
+    # Fail before any work starts if the API key is missing
+    try:
+        _get_api_key()
+    except MissingAPIKeyError as e:
+        print(f"ERROR: {str(e)}", file=sys.stderr)
+        sys.exit(1)
 
     try:
         # Validate dates
-        datetime.strptime(args.start_date, '%m/%d/%Y')
-        datetime.strptime(args.end_date, '%m/%d/%Y')
+        validate_date_format(args.start_date)
+        validate_date_format(args.end_date)
 
         # Run conversion
         convert_syllabus_to_calendar(
@@ -767,14 +1370,20 @@ Example:
             semester_start=args.start_date,
             semester_end=args.end_date,
             output_file=args.output,
-            timezone=args.timezone
+            timezone=args.timezone,
+            cache_dir=cache_dir
         )
 
         print(f"\n[SUCCESS] SUCCESS: Calendar file created at {args.output}")
         sys.exit(0)
 
+    except MissingAPIKeyError as e:
+        print(f"\n[ERROR] ERROR: {str(e)}", file=sys.stderr)
+        sys.exit(1)
     except ValueError as e:
-        print(f"\n[ERROR] ERROR: Invalid date format. Use MM/DD/YYYY", file=sys.stderr)
+        # Date format problems and extraction/parsing failures both surface as
+        # ValueError; their messages say which one occurred
+        print(f"\n[ERROR] ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"\n[ERROR] ERROR: {str(e)}", file=sys.stderr)